@@ -12,19 +12,436 @@ Agents:
 5. MarketingAgent - Creates promotional strategy
 """
 
+import asyncio
+import functools
+import hashlib
+import re
+import sys
 from datetime import datetime
+from pathlib import Path
 from config import Config
 import json
+from typing import Any, Dict, List
 
-# Try to import OpenAI client
+# The OpenAI/Anthropic SDKs are imported in ConferencePlanningWorkflow.__init__,
+# so importing this module (e.g. to inspect it) doesn't pay for loading them
 try:
-    from openai import OpenAI
+    from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential, wait_random
 except ImportError:
-    print("ERROR: OpenAI client is not installed!")
+    print("ERROR: tenacity is not installed!")
     print("Please run: pip install -r ../requirements.txt")
     exit(1)
 
 
+SEP = "=" * 80
+DASH = "-" * 80
+
+# Sections of the final report: (heading, key in ConferencePlanningWorkflow.outputs)
+REPORT_SECTIONS = [
+    ("THEME & VISION", "theme"),
+    ("SPEAKERS & TOPICS", "speakers"),
+    ("CONFERENCE SCHEDULE", "schedule"),
+    ("LOGISTICS PLAN", "logistics"),
+    ("MARKETING STRATEGY", "marketing"),
+]
+
+
+# ============================================================================
+# SYSTEM PROMPTS
+# ============================================================================
+# System prompts are plain constants (no f-strings) so every request starts
+# with the same bytes. Providers with automatic prompt caching (OpenAI, Groq)
+# only reuse a cached prefix of 1024+ tokens, so all phases share the long
+# PLANNING_GUIDELINES block first and add their role-specific part after it.
+# Anything that changes per run (conference name, type, duration, earlier
+# phase outputs) goes at the end of the user message instead.
+
+PLANNING_GUIDELINES = """You are one member of a team of specialist agents that together plan a professional \
+technology conference. Each agent owns one part of the plan (theme and vision, speakers and sessions, \
+the schedule, venue logistics, and marketing) and receives the relevant work of the agents that ran before it. \
+The combined output is handed to a human organizing committee, who will use it as the working draft for the event.
+
+General guidelines that apply to every agent on the team:
+
+1. Audience of your writing
+- Write for a busy organizing committee made up of volunteers and staff with mixed backgrounds.
+- Assume the reader knows what a conference is, but not the specifics of this event.
+- Prefer plain, concrete language over marketing buzzwords or vague aspirations.
+- When you use an industry term (for example "unconference", "birds-of-a-feather", or "hybrid track"), \
+make its meaning clear from context.
+
+2. Consistency with the rest of the plan
+- Treat the conference details and earlier agent outputs given in the user message as decisions that have \
+already been made. Build on them rather than contradicting or re-deciding them.
+- Reuse the names of tracks, session types, and themes exactly as earlier agents wrote them, so the final \
+plan reads as one coherent document.
+- If earlier material is missing, ambiguous, or clearly unrealistic, make a reasonable assumption, state it \
+in one short sentence, and continue.
+- Keep the conference length given in the user message. Do not add or remove days.
+
+3. Realism and feasibility
+- Recommendations must be achievable by a mid-sized organizing team with a realistic budget.
+- Use realistic numbers: session lengths of 15-60 minutes, keynotes of 30-45 minutes, workshops of \
+90-180 minutes, breaks of 15-30 minutes, and lunch of 45-75 minutes.
+- Do not invent specific real people, companies, venues, or sponsors. Describe roles and profiles instead \
+(for example "a principal engineer who has run large-scale ML systems in production").
+- Avoid promises that depend on outside parties agreeing (for example "a keynote from a famous CEO").
+- Consider accessibility, inclusion, and attendee wellbeing: step-free access, captioning, quiet spaces, \
+dietary needs, a code of conduct, and reasonable daily hours.
+
+4. Structure of your answer
+- Start directly with the content. Do not greet the reader, restate the task, or describe what you are \
+about to do.
+- Use short headings and bullet points so the committee can scan the plan quickly.
+- Put the most important decisions first within each section.
+- Respect the word limit given in your role instructions. Going over the limit makes the combined plan \
+harder to read; it is better to cut low-value detail than to compress everything.
+- Do not end with a summary of what you wrote or an offer to help further.
+
+5. Tone
+- Professional, confident, and practical.
+- Enthusiastic where it helps (theme and marketing), neutral and precise where it matters (schedule and \
+logistics).
+- Avoid exaggerated claims such as "the best conference ever" or "revolutionary".
+
+6. Formatting conventions
+- Write times in 12-hour format with am/pm (for example "9:00am - 9:45am").
+- Refer to days as "Day 1", "Day 2", and so on rather than calendar dates, because dates are not final yet.
+- Write money amounts in US dollars with a currency symbol (for example "$499"), and give ranges where \
+an exact figure would be guesswork.
+- Write attendee counts, room capacities, and other quantities as numbers rather than words.
+- Use the same bullet style throughout your answer: a hyphen followed by a space.
+- Keep headings short (two to five words) and do not number them unless order matters.
+- Do not use tables, code blocks, or emoji; the plan is saved as plain text.
+
+7. Working with earlier agent outputs
+- Earlier outputs are drafts written by other agents under the same guidelines. Skim them for the \
+decisions that affect your part: the tagline, the target audience, the track names, the session types, \
+and the time slots.
+- Quote track and session names exactly so the committee can match them across sections.
+- Do not repeat large parts of earlier outputs in your answer. Refer to them briefly and spend your word \
+budget on your own part of the plan.
+- If two earlier outputs disagree with each other, follow the most recent one and mention the conflict \
+in one short sentence.
+- Your answer will be passed to later agents in the same way, so make your key decisions easy to find.
+
+8. Quality checklist before you answer
+- Does every item you list serve the conference theme and the stated target audience?
+- Is everything consistent with the decisions in the user message?
+- Could the organizing committee act on each recommendation without asking a follow-up question?
+- Is the answer within the word limit and free of filler?
+
+Your specific role and instructions for this part of the plan follow.
+"""
+
+THEME_SYSTEM_PROMPT = PLANNING_GUIDELINES + """
+ROLE: Conference theme strategist.
+Define a compelling conference theme and vision for the conference type given by the user. Include:
+- Conference theme/tagline (creative and memorable)
+- Target audience (who should attend?)
+- Key topics/tracks (3-4 main themes)
+- Conference goals and value proposition
+Keep it concise - 200 words."""
+
+SPEAKERS_SYSTEM_PROMPT = PLANNING_GUIDELINES + """
+ROLE: Speaker curator.
+Based on the conference theme, identify:
+- 6-8 potential speaker profiles (roles/expertise, not specific names)
+- Session types (keynotes, workshops, panels, lightning talks)
+- Topic suggestions for each track
+- Speaking format recommendations
+Keep it concise - 200 words."""
+
+SCHEDULE_SYSTEM_PROMPT = PLANNING_GUIDELINES + """
+ROLE: Conference schedule planner.
+Based on the theme and speaker information, create a detailed agenda for the full conference duration:
+- Day-by-day breakdown
+- Time slots for each session (use realistic times: 9am-5pm)
+- Balance of keynotes, workshops, panels, and networking
+- Include breaks, meals, and networking time
+- Note parallel tracks if applicable
+Keep it structured and clear - 250 words."""
+
+_LOGISTICS_BRIEF = """Based on the schedule and expected attendees, plan:
+- Venue requirements (room sizes, AV equipment, layout)
+- Catering needs (meals, breaks, dietary considerations)
+- Registration and check-in process
+- Technology requirements (WiFi, streaming, app)
+- Contingency plans
+Keep it practical and concise - 200 words."""
+
+_MARKETING_BRIEF = """Based on all conference details, create a marketing plan:
+- Key marketing messages and positioning
+- Target promotion channels (social media, email, partnerships)
+- Early bird vs regular pricing strategy
+- Promotional timeline (3 months before event)
+- Content marketing ideas
+Keep it actionable - 200 words."""
+
+LOGISTICS_MARKETING_SYSTEM_PROMPT = PLANNING_GUIDELINES + """
+ROLE: Conference logistics coordinator AND conference marketing strategist.
+Both parts are written in one answer because they rely on the same theme and schedule.
+
+Part 1 - Logistics. """ + _LOGISTICS_BRIEF + """
+
+Part 2 - Marketing. """ + _MARKETING_BRIEF + """
+
+Respond with a single JSON object with exactly two string fields, "logistics" and "marketing", each
+holding the plain-text plan for that part (headings and hyphen bullets separated by newlines)."""
+
+# Fallbacks, one request each, for when the combined reply can't be parsed
+LOGISTICS_SYSTEM_PROMPT = PLANNING_GUIDELINES + """
+ROLE: Conference logistics coordinator.
+""" + _LOGISTICS_BRIEF
+
+MARKETING_SYSTEM_PROMPT = PLANNING_GUIDELINES + """
+ROLE: Conference marketing strategist.
+""" + _MARKETING_BRIEF
+
+
+async def cached_completion(client, stream: bool = False, **kwargs) -> str:
+    """
+    Return the message content for a chat completion, reusing a saved response when possible.
+
+    Responses are stored as JSON files in Config.RESPONSE_CACHE_DIR, keyed on a SHA-256 of
+    the model, messages and temperature. Requests above Config.RESPONSE_CACHE_MAX_TEMPERATURE
+    always go to the API, since a caller asking for varied output shouldn't get the same
+    answer on every run.
+
+    With stream=True the reply is printed to stdout as it arrives (or all at once on a
+    cache hit) instead of only being returned when the completion finishes.
+    """
+    cacheable = kwargs["temperature"] <= Config.RESPONSE_CACHE_MAX_TEMPERATURE
+    if cacheable:
+        key = hashlib.sha256(json.dumps({
+            "model": kwargs["model"],
+            "messages": kwargs["messages"],
+            "temperature": kwargs["temperature"],
+            "response_format": kwargs.get("response_format"),
+        }, sort_keys=True).encode("utf-8")).hexdigest()
+        cache_file = Path(Config.RESPONSE_CACHE_DIR) / f"{key}.json"
+        if cache_file.exists():
+            content = json.loads(cache_file.read_text())["content"]
+            if stream:
+                print(content)
+            return content
+
+    send = _anthropic_request if Config.PROVIDER == "anthropic" else _openai_request
+    content = await send(client, stream, **kwargs)
+
+    if cacheable:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(json.dumps({"model": kwargs["model"], "content": content}))
+    return content
+
+
+async def _openai_request(client, stream: bool, **kwargs) -> str:
+    """Send a chat completion through the OpenAI SDK and return the reply text"""
+    if not stream:
+        response = await client.chat.completions.create(**kwargs)
+        return response.choices[0].message.content
+
+    parts = []
+    async for chunk in await client.chat.completions.create(stream=True, **kwargs):
+        delta = (chunk.choices[0].delta.content or "") if chunk.choices else ""
+        print(delta, end="", flush=True)
+        parts.append(delta)
+    print()
+    return "".join(parts)
+
+
+async def _anthropic_request(client, stream: bool, **kwargs) -> str:
+    """
+    Send an OpenAI-style chat request through the Anthropic SDK and return the reply text.
+
+    Anthropic only caches prompts that are explicitly marked, so the system prompt is sent
+    as a text block with cache_control set to ephemeral. response_format is dropped: the
+    prompts that use it already ask for JSON in their instructions.
+    """
+    kwargs.pop("response_format", None)
+    messages = kwargs.pop("messages")
+    request = dict(
+        system=[
+            {"type": "text", "text": m["content"], "cache_control": {"type": "ephemeral"}}
+            for m in messages if m["role"] == "system"
+        ],
+        messages=[m for m in messages if m["role"] != "system"],
+        **kwargs,
+    )
+    if not stream:
+        response = await client.messages.create(**request)
+        return "".join(block.text for block in response.content if block.type == "text")
+
+    parts = []
+    async with client.messages.stream(**request) as response:
+        async for text in response.text_stream:
+            print(text, end="", flush=True)
+            parts.append(text)
+    print()
+    return "".join(parts)
+
+
+def _is_retryable(exc: BaseException) -> bool:
+    """True for transient API errors (rate limits, connection errors, 5xx) from either SDK"""
+    for sdk in (sys.modules.get("openai"), sys.modules.get("anthropic")):
+        if sdk is None:
+            continue
+        if isinstance(exc, (sdk.RateLimitError, sdk.APIConnectionError)):
+            return True
+        # Any 5xx, including Anthropic's 529 OverloadedError (not an InternalServerError subclass)
+        if isinstance(exc, sdk.APIStatusError) and exc.status_code >= 500:
+            return True
+    # A connection dropped while a streamed reply is being read surfaces as the raw httpx error
+    httpx = sys.modules.get("httpx")
+    return httpx is not None and isinstance(exc, httpx.TransportError)
+
+
+def _announce_retry(retry_state) -> None:
+    """
+    tenacity before_sleep hook: say that the request is being retried.
+
+    A stream that fails part-way has already printed some of its reply; the marker
+    shows where that partial text ends and the retried reply starts.
+    """
+    exc = retry_state.outcome.exception()
+    print(f"\n[{type(exc).__name__}: {exc} - retrying in {retry_state.next_action.sleep:.1f}s "
+          f"(attempt {retry_state.attempt_number + 1} of {Config.MAX_RETRIES + 1})...]", flush=True)
+
+
+# ============================================================================
+# PHASE SUMMARIES
+# ============================================================================
+# Later phases only need a handful of decisions from earlier ones, so they are
+# sent a short JSON summary instead of the full text. The full outputs are
+# still used for the final report.
+
+THEME_SUMMARY_SCHEMA = ("theme_tagline", "audience", "tracks")
+SCHEDULE_SUMMARY_SCHEMA = ("key_slots",)
+
+# Outputs that get a summary, and the schema to use for it
+SUMMARY_SCHEMAS = {
+    "theme": THEME_SUMMARY_SCHEMA,
+    "schedule": SCHEDULE_SUMMARY_SCHEMA,
+}
+
+_BULLET = re.compile(r"^\s*(?:[-*\u2022]|\d+[.)])\s+")
+_TIME_SLOT = re.compile(r"\b\d{1,2}(?::\d{2})?\s*(?:am|pm)\b", re.IGNORECASE)
+_DAY_HEADING = re.compile(r"^\W*day\s+\d+", re.IGNORECASE)
+
+
+def _clean_line(line: str) -> str:
+    """Strip bullets and markdown emphasis/heading markers from a line"""
+    return _BULLET.sub("", line).replace("**", "").strip(" #*_")
+
+
+def _labelled_value(lines: List[str], pattern: str) -> str:
+    """Return the text after the first line labelled with pattern (or the line below it)"""
+    for i, line in enumerate(lines):
+        if re.search(pattern, line, re.IGNORECASE):
+            value = _clean_line(line.split(":", 1)[1]) if ":" in line else ""
+            if not value and i + 1 < len(lines):
+                value = _clean_line(lines[i + 1])
+            return value
+    return ""
+
+
+def _bullets_after(lines: List[str], pattern: str, limit: int = 6) -> List[str]:
+    """Return the bullet items listed under the first heading matching pattern"""
+    for i, line in enumerate(lines):
+        if re.search(pattern, line, re.IGNORECASE) and not _BULLET.match(line):
+            items = []
+            for item in lines[i + 1:]:
+                if not _BULLET.match(item):
+                    break
+                # Keep only the item name, e.g. "- **Edge AI**: running models..." -> "Edge AI"
+                items.append(re.split(r":| - ", _clean_line(item), maxsplit=1)[0].strip())
+            return items[:limit]
+    return []
+
+
+def _slots_by_day(lines: List[str], per_day: int = 5) -> List[str]:
+    """Return each day heading followed by its first few non-break time slots"""
+    slots, taken = [], 0
+    for line in lines:
+        cleaned = _clean_line(line)
+        if _DAY_HEADING.match(cleaned):
+            slots.append(cleaned[:80])
+            taken = 0
+        elif _TIME_SLOT.search(line) and taken < per_day and not re.search(r"\bbreak\b", line, re.IGNORECASE):
+            slots.append(cleaned[:80])
+            taken += 1
+    return slots
+
+
+def extract_summary(text: str, schema: tuple) -> Dict[str, Any]:
+    """
+    Build a small structured summary of a phase output using text heuristics.
+
+    Supported schema fields: theme_tagline, audience, tracks, key_slots.
+    """
+    lines = [line for line in text.splitlines() if line.strip()]
+    summary = {}
+    if "theme_tagline" in schema:
+        summary["theme_tagline"] = (_labelled_value(lines, r"tagline|theme")
+                                    or (_clean_line(lines[0]) if lines else ""))
+    if "audience" in schema:
+        # Usually a bulleted list of groups; fall back to an inline "Audience: ..." value
+        summary["audience"] = (_bullets_after(lines, r"audience")
+                               or [value for value in [_labelled_value(lines, r"audience")] if value])
+    if "tracks" in schema:
+        summary["tracks"] = _bullets_after(lines, r"track|topic")
+    if "key_slots" in schema:
+        summary["key_slots"] = _slots_by_day(lines)
+    return summary
+
+
+_CODE_FENCE = re.compile(r"^\s*```(?:json)?\s*(.*?)\s*```\s*$", re.S)
+
+
+def parse_plans(text: str, keys: tuple = ("logistics", "marketing")) -> Dict[str, str]:
+    """
+    Parse the combined logistics/marketing JSON reply into one plain-text plan per key.
+
+    Tolerates a reply wrapped in a Markdown code fence (endpoints without JSON mode
+    often add one). Raises ValueError if the reply isn't a JSON object with a
+    non-empty value for every key.
+    """
+    fenced = _CODE_FENCE.match(text)
+    data = json.loads(fenced.group(1) if fenced else text)  # JSONDecodeError is a ValueError
+    if not isinstance(data, dict):
+        raise ValueError("reply is not a JSON object")
+    plans = {}
+    for key in keys:
+        plan = data.get(key)
+        if not plan:
+            raise ValueError(f"reply has no '{key}' plan")
+        plans[key] = plan if isinstance(plan, str) else json.dumps(plan, indent=2)
+    return plans
+
+
+# ============================================================================
+# PHASE DEPENDENCIES
+# ============================================================================
+# The earlier phases each phase reads from, in execution order. A phase starts
+# as soon as its dependencies are done. Logistics and marketing both only need
+# theme + schedule, so they are produced together by a single request.
+
+PHASE_DEPENDENCIES = {
+    "theme": [],
+    "speakers": ["theme"],
+    "schedule": ["theme", "speakers"],
+    "logistics_marketing": ["theme", "schedule"],
+}
+
+# The keys each phase stores in ConferencePlanningWorkflow.outputs
+PHASE_OUTPUTS = {
+    "theme": ["theme"],
+    "speakers": ["speakers"],
+    "schedule": ["schedule"],
+    "logistics_marketing": ["logistics", "marketing"],
+}
+
+
 class ConferencePlanningWorkflow:
     """Custom workflow for tech conference planning"""
 
@@ -34,236 +451,250 @@ class ConferencePlanningWorkflow:
             print("ERROR: Configuration validation failed!")
             exit(1)
 
-        self.client = OpenAI(api_key=Config.API_KEY, base_url=Config.API_BASE)
+        try:
+            import httpx
+            from openai import AsyncOpenAI
+        except ImportError:
+            print("ERROR: OpenAI client is not installed!")
+            print("Please run: pip install -r ../requirements.txt")
+            exit(1)
+
+        # One pooled HTTP/2 connection is shared by every phase, so the TCP + TLS
+        # handshake is paid once and concurrent requests are multiplexed over it
+        self._http = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+            timeout=httpx.Timeout(Config.AGENT_TIMEOUT),
+        )
+        # Retries are handled (with backoff) by _call, so the client itself doesn't retry
+        if Config.PROVIDER == "anthropic":
+            try:
+                import anthropic
+            except ImportError:
+                print("ERROR: PROVIDER is 'anthropic' but the Anthropic SDK is not installed!")
+                print("Please run: pip install anthropic")
+                exit(1)
+            # The Anthropic SDK adds /v1 itself; API_BASE may point at the OpenAI-compatible path.
+            # If only PROVIDER was set, API_BASE is still OpenAI's, so use the SDK's default host
+            base_url = Config.API_BASE.rstrip("/").removesuffix("/v1")
+            if "api.openai.com" in base_url:
+                base_url = None
+            self.client = anthropic.AsyncAnthropic(
+                api_key=Config.API_KEY, base_url=base_url, http_client=self._http, max_retries=0)
+        else:
+            self.client = AsyncOpenAI(api_key=Config.API_KEY, base_url=Config.API_BASE,
+                                      http_client=self._http, max_retries=0)
         self.outputs = {}
+        self.summaries = {}
+        self._futures = {}
         self.model = Config.OPENAI_MODEL
+        # Request settings shared by every phase, so all calls go through one code path
+        self._complete = functools.partial(
+            cached_completion,
+            self.client,
+            model=self.model,
+            temperature=Config.AGENT_TEMPERATURE,
+            max_tokens=Config.AGENT_MAX_TOKENS,
+        )
         self.conference_name = conference_name
         self.conference_type = conference_type
         self.duration = duration
 
+        # Outputs are appended here as each phase finishes; the file is removed after
+        # a complete run, so it only exists when a previous run stopped part-way.
+        # The name includes a hash of everything the outputs depend on, so changing
+        # the type, duration or model starts fresh instead of resuming a different plan
+        slug = re.sub(r"[^a-z0-9]+", "-", conference_name.lower()).strip("-")
+        run_key = hashlib.sha256(json.dumps(
+            [conference_name, conference_type, duration, self.model]).encode()).hexdigest()[:12]
+        self._checkpoint_file = Path(Config.OUTPUT_DIR) / f"checkpoint_{slug}_{run_key}.jsonl"
+        self._loaded_checkpoint = self._load_checkpoint()
+
     def run(self):
         """Execute the complete conference planning workflow"""
-        print("\n" + "="*80)
+        print("\n" + SEP)
         print(f"CONFERENCE PLANNING WORKFLOW - {self.conference_name.upper()}")
-        print("="*80)
+        print(SEP)
         print(f"Conference Type: {self.conference_type}")
         print(f"Duration: {self.duration}")
         print(f"Start Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         print(f"Model: {self.model}\n")
 
-        # Phase 1: Theme & Vision
-        self.phase_theme()
-
-        # Phase 2: Speaker Curation
-        self.phase_speakers()
-
-        # Phase 3: Schedule Creation
-        self.phase_schedule()
-
-        # Phase 4: Logistics Planning
-        self.phase_logistics()
-
-        # Phase 5: Marketing Strategy
-        self.phase_marketing()
+        asyncio.run(self._run_async())
 
         # Summary
         self.print_summary()
 
-    def phase_theme(self):
+        # Every phase finished and the plan is saved, so the next run starts fresh
+        self._checkpoint_file.unlink(missing_ok=True)
+
+    @retry(
+        stop=stop_after_attempt(Config.MAX_RETRIES + 1),
+        wait=wait_exponential(multiplier=1, min=1, max=Config.RETRY_MAX_WAIT) + wait_random(0, 1),
+        retry=retry_if_exception(_is_retryable),
+        before_sleep=_announce_retry,
+        reraise=True,
+    )
+    async def _call(self, system: str, user: str, stream: bool = False, **kwargs) -> str:
+        """
+        Send one system + user message exchange and return the reply text.
+
+        Rate limits, connection errors (including a stream cut off part-way) and 5xx
+        responses are retried with exponential backoff and jitter, so a transient
+        failure doesn't abort the whole workflow.
+        Extra keyword arguments (e.g. response_format) are passed on to the API request.
+        """
+        return await self._complete(stream=stream, messages=[
+            {"role": "system", "content": system},
+            {"role": "user", "content": user},
+        ], **kwargs)
+
+    async def _run_async(self):
+        """Start every phase as a task that waits only on the phases it depends on"""
+        try:
+            for name, deps in PHASE_DEPENDENCIES.items():
+                self._futures[name] = asyncio.create_task(self._run_phase(name, deps))
+            await asyncio.gather(*self._futures.values())
+        finally:
+            # Pooled connections belong to this event loop; close them before asyncio.run() ends it
+            await self._http.aclose()
+
+    async def _run_phase(self, name: str, deps: List[str]):
+        """Wait for a phase's dependencies, then run it (or restore it from the checkpoint)"""
+        await asyncio.gather(*(self._futures[dep] for dep in deps))
+        keys = PHASE_OUTPUTS[name]
+        if all(key in self._loaded_checkpoint for key in keys):
+            print(f"\n[Resuming: {', '.join(keys)} loaded from {self._checkpoint_file.name}]")
+            for key in keys:
+                self._store(key, self._loaded_checkpoint[key], checkpoint=False)
+            return
+        await getattr(self, f"phase_{name}")()
+
+    def _store(self, key: str, content: str, checkpoint: bool = True):
+        """Record a phase output, its summary (if later phases use one) and a checkpoint line"""
+        self.outputs[key] = content
+        if key in SUMMARY_SCHEMAS:
+            self.summaries[key] = extract_summary(content, SUMMARY_SCHEMAS[key])
+        if checkpoint:
+            self._checkpoint(key, content)
+
+    def _checkpoint(self, key: str, content: str):
+        """Append a phase output to the checkpoint file so a crashed run can resume"""
+        with open(self._checkpoint_file, "a") as f:
+            f.write(json.dumps({"phase": key, "content": content, "ts": datetime.now().isoformat()}) + "\n")
+
+    def _load_checkpoint(self) -> Dict[str, str]:
+        """Read the outputs saved by a previous, unfinished run of this conference"""
+        loaded = {}
+        if self._checkpoint_file.exists():
+            for line in self._checkpoint_file.read_text().splitlines():
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # A crash mid-write can leave a partial last line
+                loaded[entry["phase"]] = entry["content"]
+        return loaded
+
+    async def phase_theme(self):
         """Phase 1: Conference Theme & Vision"""
-        print("\n" + "="*80)
+        print("\n" + SEP)
         print("PHASE 1: CONFERENCE THEME & VISION")
-        print("="*80)
+        print(SEP)
         print("[ThemeAgent is defining the conference vision...]")
 
-        system_prompt = f"""You are a conference theme strategist specializing in {self.conference_type} events.
-Define a compelling conference theme and vision. Include:
-- Conference theme/tagline (creative and memorable)
-- Target audience (who should attend?)
-- Key topics/tracks (3-4 main themes)
-- Conference goals and value proposition
-Keep it concise - 200 words."""
+        user_message = f"""Create a compelling theme and vision for this conference.
 
-        user_message = f"Create a compelling theme and vision for '{self.conference_name}', a {self.duration} {self.conference_type} conference."
+Conference Name: {self.conference_name}
+Conference Type: {self.conference_type}
+Duration: {self.duration}"""
 
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                temperature=Config.AGENT_TEMPERATURE,
-                max_tokens=Config.AGENT_MAX_TOKENS,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_message}
-                ]
-            )
-
-            self.outputs["theme"] = response.choices[0].message.content
             print("\n[ThemeAgent Output]")
-            print(self.outputs["theme"])
+            self._store("theme", await self._call(THEME_SYSTEM_PROMPT, user_message, stream=True))
         except Exception as e:
             print(f"❌ Error: {e}")
             raise
 
-    def phase_speakers(self):
+    async def phase_speakers(self):
         """Phase 2: Speaker & Topic Curation"""
-        print("\n" + "="*80)
+        print("\n" + SEP)
         print("PHASE 2: SPEAKER & TOPIC CURATION")
-        print("="*80)
+        print(SEP)
         print("[SpeakerAgent is identifying speakers and sessions...]")
 
-        system_prompt = f"""You are a speaker curator for {self.conference_type} conferences.
-Based on the conference theme, identify:
-- 6-8 potential speaker profiles (roles/expertise, not specific names)
-- Session types (keynotes, workshops, panels, lightning talks)
-- Topic suggestions for each track
-- Speaking format recommendations
-Keep it concise - 200 words."""
+        user_message = f"""Identify ideal speaker profiles and session topics for this conference.
 
-        user_message = f"""Conference Theme and Vision:
-{self.outputs['theme']}
+Conference Type: {self.conference_type}
+Duration: {self.duration}
 
-Now identify ideal speaker profiles and session topics for this {self.duration} conference."""
+Conference Theme and Vision:
+{self.outputs['theme']}"""
 
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                temperature=Config.AGENT_TEMPERATURE,
-                max_tokens=Config.AGENT_MAX_TOKENS,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_message}
-                ]
-            )
-
-            self.outputs["speakers"] = response.choices[0].message.content
             print("\n[SpeakerAgent Output]")
-            print(self.outputs["speakers"])
+            self._store("speakers", await self._call(SPEAKERS_SYSTEM_PROMPT, user_message, stream=True))
         except Exception as e:
             print(f"❌ Error: {e}")
             raise
 
-    def phase_schedule(self):
+    async def phase_schedule(self):
         """Phase 3: Detailed Schedule Creation"""
-        print("\n" + "="*80)
+        print("\n" + SEP)
         print("PHASE 3: DETAILED SCHEDULE CREATION")
-        print("="*80)
+        print(SEP)
         print("[ScheduleAgent is creating the conference agenda...]")
 
-        system_prompt = f"""You are a conference schedule planner.
-Based on the theme and speaker information, create a detailed {self.duration} agenda:
-- Day-by-day breakdown
-- Time slots for each session (use realistic times: 9am-5pm)
-- Balance of keynotes, workshops, panels, and networking
-- Include breaks, meals, and networking time
-- Note parallel tracks if applicable
-Keep it structured and clear - 250 words."""
+        user_message = f"""Create a detailed conference schedule.
 
-        user_message = f"""Conference Theme:
-{self.outputs['theme']}
+Duration: {self.duration}
 
-Speaker & Session Information:
-{self.outputs['speakers']}
+Conference Theme (summary):
+{json.dumps(self.summaries['theme'])}
 
-Create a detailed {self.duration} conference schedule."""
+Speaker & Session Information:
+{self.outputs['speakers']}"""
 
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                temperature=Config.AGENT_TEMPERATURE,
-                max_tokens=Config.AGENT_MAX_TOKENS,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_message}
-                ]
-            )
-
-            self.outputs["schedule"] = response.choices[0].message.content
             print("\n[ScheduleAgent Output]")
-            print(self.outputs["schedule"])
+            self._store("schedule", await self._call(SCHEDULE_SYSTEM_PROMPT, user_message, stream=True))
         except Exception as e:
             print(f"❌ Error: {e}")
             raise
 
-    def phase_logistics(self):
-        """Phase 4: Logistics Planning"""
-        print("\n" + "="*80)
-        print("PHASE 4: LOGISTICS PLANNING")
-        print("="*80)
+    async def phase_logistics_marketing(self):
+        """Phases 4 & 5: Logistics Planning and Marketing Strategy (one request)"""
+        print("\n" + SEP)
+        print("PHASES 4 & 5: LOGISTICS PLANNING & MARKETING STRATEGY")
+        print(SEP)
         print("[LogisticsAgent is planning venue and logistics...]")
+        print("[MarketingAgent is creating promotional strategy...]")
 
-        system_prompt = """You are a conference logistics coordinator.
-Based on the schedule and expected attendees, plan:
-- Venue requirements (room sizes, AV equipment, layout)
-- Catering needs (meals, breaks, dietary considerations)
-- Registration and check-in process
-- Technology requirements (WiFi, streaming, app)
-- Contingency plans
-Keep it practical and concise - 200 words."""
-
-        user_message = f"""Conference Schedule:
-{self.outputs['schedule']}
+        user_message = f"""Plan the logistics and create a comprehensive marketing strategy for this conference.
 
-Conference Theme & Audience:
-{self.outputs['theme']}
+Conference Theme & Audience (summary):
+{json.dumps(self.summaries['theme'])}
 
-Plan the logistics for this conference."""
+Conference Schedule (key slots):
+{json.dumps(self.summaries['schedule'])}"""
 
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                temperature=Config.AGENT_TEMPERATURE,
-                max_tokens=Config.AGENT_MAX_TOKENS,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_message}
-                ]
-            )
-
-            self.outputs["logistics"] = response.choices[0].message.content
+            content = await self._call(LOGISTICS_MARKETING_SYSTEM_PROMPT, user_message,
+                                       response_format={"type": "json_object"})
+            try:
+                plans = parse_plans(content)
+            except ValueError as e:
+                # Don't lose the earlier (paid) phases over a malformed reply: ask separately
+                print(f"⚠️  Combined reply unusable ({e}); requesting logistics and marketing separately")
+                logistics, marketing = await asyncio.gather(
+                    self._call(LOGISTICS_SYSTEM_PROMPT, user_message),
+                    self._call(MARKETING_SYSTEM_PROMPT, user_message),
+                )
+                plans = {"logistics": logistics, "marketing": marketing}
+            for key, plan in plans.items():
+                self._store(key, plan)
+
             print("\n[LogisticsAgent Output]")
             print(self.outputs["logistics"])
-        except Exception as e:
-            print(f"❌ Error: {e}")
-            raise
-
-    def phase_marketing(self):
-        """Phase 5: Marketing Strategy"""
-        print("\n" + "="*80)
-        print("PHASE 5: MARKETING STRATEGY")
-        print("="*80)
-        print("[MarketingAgent is creating promotional strategy...]")
-
-        system_prompt = """You are a conference marketing strategist.
-Based on all conference details, create a marketing plan:
-- Key marketing messages and positioning
-- Target promotion channels (social media, email, partnerships)
-- Early bird vs regular pricing strategy
-- Promotional timeline (3 months before event)
-- Content marketing ideas
-Keep it actionable - 200 words."""
-
-        user_message = f"""Conference Details:
-
-Theme & Vision:
-{self.outputs['theme']}
-
-Schedule Overview:
-{self.outputs['schedule']}
-
-Create a comprehensive marketing strategy for this conference."""
-
-        try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                temperature=Config.AGENT_TEMPERATURE,
-                max_tokens=Config.AGENT_MAX_TOKENS,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_message}
-                ]
-            )
-
-            self.outputs["marketing"] = response.choices[0].message.content
             print("\n[MarketingAgent Output]")
             print(self.outputs["marketing"])
         except Exception as e:
@@ -272,9 +703,9 @@ Create a comprehensive marketing strategy for this conference."""
 
     def print_summary(self):
         """Print final summary"""
-        print("\n" + "="*80)
+        print("\n" + SEP)
         print("CONFERENCE PLANNING SUMMARY")
-        print("="*80)
+        print(SEP)
 
         print(f"""
 ✅ Conference: {self.conference_name}
@@ -291,46 +722,32 @@ This workflow demonstrated a 5-agent collaboration:
 Each agent built upon previous outputs to create a comprehensive conference plan.
 """)
 
-        # Print full results
-        print("\n" + "="*80)
-        print("FULL CONFERENCE PLAN - ALL COMPONENTS")
-        print("="*80)
-        
-        sections = [
-            ("THEME & VISION", "theme"),
-            ("SPEAKERS & TOPICS", "speakers"),
-            ("CONFERENCE SCHEDULE", "schedule"),
-            ("LOGISTICS PLAN", "logistics"),
-            ("MARKETING STRATEGY", "marketing")
-        ]
-        
-        for title, key in sections:
-            print("\n" + "-"*80)
-            print(f"{title}")
-            print("-"*80)
-            print(self.outputs[key])
+        # Build each part of the report once, then print/write it in one call
+        section_lines = []
+        for title, key in REPORT_SECTIONS:
+            section_lines.extend(["", DASH, title, DASH, self.outputs[key]])
+
+        print("\n".join(["", SEP, "FULL CONFERENCE PLAN - ALL COMPONENTS", SEP] + section_lines))
 
         # Save to file
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         output_file = f"conference_plan_{timestamp}.txt"
+        report = "\n".join([
+            SEP,
+            f"CONFERENCE PLANNING - {self.conference_name.upper()}",
+            SEP,
+            f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+            f"Model: {self.model}",
+            f"Type: {self.conference_type}",
+            f"Duration: {self.duration}",
+            "",
+        ] + section_lines) + "\n"
         with open(output_file, 'w') as f:
-            f.write("="*80 + "\n")
-            f.write(f"CONFERENCE PLANNING - {self.conference_name.upper()}\n")
-            f.write("="*80 + "\n")
-            f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write(f"Model: {self.model}\n")
-            f.write(f"Type: {self.conference_type}\n")
-            f.write(f"Duration: {self.duration}\n\n")
-            
-            for title, key in sections:
-                f.write("\n" + "-"*80 + "\n")
-                f.write(f"{title}\n")
-                f.write("-"*80 + "\n")
-                f.write(self.outputs[key] + "\n")
-        
+            f.write(report)
+
         print(f"\n💾 Full conference plan saved to: {output_file}")
         print(f"\nEnd Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        print("="*80)
+        print(SEP)
 
 
 if __name__ == "__main__":
@@ -346,10 +763,10 @@ if __name__ == "__main__":
     """
     
     print("\n🎯 EXERCISE 4: CUSTOM PROBLEM - CONFERENCE PLANNING")
-    print("="*80)
+    print(SEP)
     print("This demo shows how to adapt AutoGen for different problem domains.")
     print("We're planning a multi-day tech conference using 5 specialized agents.")
-    print("="*80)
+    print(SEP)
     
     # Customize these parameters:
     CONFERENCE_NAME = "AI Horizons 2026"
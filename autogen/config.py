@@ -38,13 +38,18 @@ class Config(SharedConfig):
 
     # AutoGen-specific settings
     HUMAN_INPUT_MODE = "NEVER"  # Agents operate autonomously
-    MAX_RETRIES = 2  # Retry failed API calls
+    MAX_RETRIES = 4  # Retry failed API calls (rate limits, connection errors, 5xx)
+    RETRY_MAX_WAIT = 30  # Upper bound in seconds for the exponential backoff between retries
 
     # Output Settings
     OUTPUT_DIR = str(Path(__file__).parent)
     SAVE_OUTPUTS = True
     CREATE_SUMMARY = True
 
+    # Response Cache Settings
+    RESPONSE_CACHE_DIR = str(Path(__file__).parent / "cache")
+    RESPONSE_CACHE_MAX_TEMPERATURE = 0.3  # Higher temperatures always call the API
+
     @classmethod
     def get_config_list(cls) -> List[Dict[str, Any]]:
         """
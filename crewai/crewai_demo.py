@@ -21,17 +21,22 @@ Configuration:
 - Environment variables set in /Users/pranavhharish/Desktop/IS-492/multi-agent/.env
 """
 
+import asyncio
+import functools
 import os
 import sys
-import json
+import threading
 from pathlib import Path
-from datetime import datetime
-from crewai import Agent, Task, Crew
+from types import MappingProxyType
+from crewai import Agent, Task, Crew, LLM
 from crewai.tools import tool
-import requests
+from joblib import Memory
+
+# Directory of this script; outputs and the report cache are kept here
+_MODULE_DIR = Path(__file__).resolve().parent
 
 # Add parent directory to path to import shared_config
-sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(_MODULE_DIR.parent))
 
 # Import shared configuration
 from shared_config import Config, validate_config
@@ -41,19 +46,10 @@ from shared_config import Config, validate_config
 # TOOLS (Real API implementations using web search)
 # ============================================================================
 
-@tool
-def search_flight_prices(destination: str, departure_city: str = "New York") -> str:
-    """
-    Search for real flight prices and options to a destination.
-    Uses web search to find current flight information from major booking sites.
-    """
-    search_query = f"flights from {departure_city} to {destination} prices 2026 best options"
-
-    # In production, this would use a real flight API (Skyscanner, Kayak, etc.)
-    # For now, the LLM will use this to inform its research
-    return f"""
-    Research task: Find flights from {departure_city} to {destination}.
+# Research prompts returned by the tools. The fixed instructions come first and
+# the call-specific details last, so repeated calls share the same prefix.
 
+_FLIGHT_TEMPLATE = """
     Please research and provide:
     1. Current flight options with prices (check Kayak, Skyscanner, Google Flights)
     2. Airlines operating these routes
@@ -62,20 +58,11 @@ def search_flight_prices(destination: str, departure_city: str = "New York") ->
     5. Seasonal pricing variations
 
     Focus on realistic, current pricing for January 2026 travel.
-    """
-
 
-@tool
-def search_hotel_options(location: str, check_in_date: str) -> str:
-    """
-    Search for real hotel options using web search.
-    Provides current hotel availability and pricing information.
+    Research task: Find flights from {departure_city} to {destination}.
     """
-    search_query = f"hotels in {location} {check_in_date} reviews ratings prices 2026"
-
-    return f"""
-    Research task: Find hotels in {location} for check-in {check_in_date}.
 
+_HOTEL_TEMPLATE = """
     Please research and provide:
     1. Top-rated hotels with guest reviews (check Booking.com, TripAdvisor, Google Hotels)
     2. Current pricing for 5-night stays
@@ -85,20 +72,11 @@ def search_hotel_options(location: str, check_in_date: str) -> str:
 
     Include budget, mid-range, and luxury options.
     Focus on hotels with high ratings and realistic current prices.
-    """
-
 
-@tool
-def search_attractions_activities(destination: str) -> str:
-    """
-    Search for real attractions and activities in a destination.
-    Provides comprehensive information about popular sites and experiences.
+    Research task: Find hotels in {location} for check-in {check_in_date}.
     """
-    search_query = f"{destination} attractions activities tours things to do 2026"
-
-    return f"""
-    Research task: Find attractions and activities in {destination}.
 
+_ATTRACTIONS_TEMPLATE = """
     Please research and provide:
     1. Top-rated attractions and their estimated visit times
     2. Popular day tours and multi-day excursions
@@ -110,20 +88,11 @@ def search_attractions_activities(destination: str) -> str:
 
     Include hidden gems and less-known but highly-rated activities.
     Focus on realistic itineraries that can be completed in 5 days.
-    """
-
 
-@tool
-def search_travel_costs(destination: str) -> str:
-    """
-    Search for real travel costs and budgeting information.
-    Provides current pricing for meals, activities, and transportation.
+    Research task: Find attractions and activities in {destination}.
     """
-    search_query = f"{destination} travel costs budget prices meals transport 2025"
-
-    return f"""
-    Research task: Find cost information for a trip to {destination}.
 
+_TRAVEL_COSTS_TEMPLATE = """
     Please research and provide:
     1. Average meal costs (budget, mid-range, restaurants)
     2. Public transportation costs and rental car prices
@@ -135,13 +104,123 @@ def search_travel_costs(destination: str) -> str:
 
     Provide realistic, current pricing information for 2025.
     Focus on actual costs travelers can expect.
+
+    Research task: Find cost information for a trip to {destination}.
     """
 
 
+@tool
+def search_flight_prices(destination: str, departure_city: str = "New York") -> str:
+    """
+    Search for real flight prices and options to a destination.
+    Uses web search to find current flight information from major booking sites.
+    """
+    # In production, this would use a real flight API (Skyscanner, Kayak, etc.)
+    # For now, the LLM will use this to inform its research
+    return _FLIGHT_TEMPLATE.format(destination=destination, departure_city=departure_city)
+
+
+@tool
+def search_hotel_options(location: str, check_in_date: str) -> str:
+    """
+    Search for real hotel options using web search.
+    Provides current hotel availability and pricing information.
+    """
+    return _HOTEL_TEMPLATE.format(location=location, check_in_date=check_in_date)
+
+
+@tool
+def search_attractions_activities(destination: str) -> str:
+    """
+    Search for real attractions and activities in a destination.
+    Provides comprehensive information about popular sites and experiences.
+    """
+    return _ATTRACTIONS_TEMPLATE.format(destination=destination)
+
+
+@tool
+def search_travel_costs(destination: str) -> str:
+    """
+    Search for real travel costs and budgeting information.
+    Provides current pricing for meals, activities, and transportation.
+    """
+    return _TRAVEL_COSTS_TEMPLATE.format(destination=destination)
+
+
 # ============================================================================
 # AGENT DEFINITIONS
 # ============================================================================
 
+# City to search for hotels in, for destinations given as a country
+_HOTEL_CITY = {"iceland": "Reykjavik", "france": "Paris", "japan": "Tokyo"}
+
+
+def _hotel_city(destination: str) -> str:
+    """Main city for hotels: the mapped city for known countries, else the destination itself."""
+    return _HOTEL_CITY.get(destination.lower(), destination)
+
+
+@functools.lru_cache(maxsize=None)
+def _shared_llm():
+    """
+    LLM used by every agent, created on first use from the shared configuration.
+
+    Agents themselves are built per run (CrewAI binds them to their crew and
+    keeps execution state on them), but they can all share one LLM and with it
+    one HTTP client, so connections and TLS sessions are reused across calls.
+    """
+    return LLM(model=Config.OPENAI_MODEL, base_url=Config.API_BASE, api_key=Config.API_KEY)
+
+
+# Destination-specific agent text, cached so agents created repeatedly for the
+# same destination (e.g. in a batch run) reuse the built strings
+
+@functools.lru_cache(maxsize=64)
+def _flight_goal(destination: str, trip_dates: str) -> str:
+    return (f"Research and recommend the best flight options for the {destination} trip "
+            f"({trip_dates}), considering dates, airlines, prices, and flight durations. "
+            f"Use real data from flight booking sites to provide accurate, current pricing.")
+
+
+@functools.lru_cache(maxsize=64)
+def _hotel_goal(hotel_location: str, destination: str, trip_dates: str) -> str:
+    return (f"Suggest top-rated hotels in {hotel_location} for the {destination} trip "
+            f"({trip_dates}), considering amenities, location, and value for money. "
+            f"Use real hotel data from booking sites with current prices and reviews.")
+
+
+@functools.lru_cache(maxsize=64)
+def _itinerary_goal(destination: str, trip_duration: str) -> str:
+    return (f"Create a detailed day-by-day travel plan with activities and attractions "
+            f"that maximize the {destination} experience in {trip_duration}. "
+            f"Use real current information about attractions, opening hours, and accessibility.")
+
+
+@functools.lru_cache(maxsize=64)
+def _itinerary_backstory(destination: str) -> str:
+    return (f"You are an award-winning travel designer with a deep cultural connection to "
+            f"{destination}. After living there for several years and leading hundreds of tours, "
+            f"you've developed an intimate understanding of the destination's soul - from iconic "
+            f"landmarks to secret local spots that tourists rarely discover. Your itineraries "
+            f"are legendary for their perfect pacing, mixing popular attractions with authentic "
+            f"experiences. You consider everything: seasonal weather patterns, crowd levels, "
+            f"optimal visiting times, and the cultural significance of each location. Travel "
+            f"bloggers often cite your recommendations, and your clients describe your itineraries "
+            f"as 'life-changing journeys' rather than simple vacation plans.")
+
+
+@functools.lru_cache(maxsize=64)
+def _budget_goal(destination: str) -> str:
+    return (f"Calculate total trip costs for {destination} and identify cost-saving opportunities "
+            f"while maintaining quality. Use real current pricing data for all expenses.")
+
+
+@functools.lru_cache(maxsize=64)
+def _marketing_goal(destination: str) -> str:
+    return (f"Create a compelling marketing summary for the {destination} trip package "
+            f"that highlights unique selling points and appeals to target travelers.")
+
+
 def create_flight_agent(destination: str, trip_dates: str):
     """Create the Flight Specialist agent with real research tools."""
     
@@ -154,9 +233,7 @@ def create_flight_agent(destination: str, trip_dates: str):
     
     return Agent(
         role="Senior Aviation Travel Consultant",  # Modified from: "Flight Specialist"
-        goal=f"Research and recommend the best flight options for the {destination} trip "
-             f"({trip_dates}), considering dates, airlines, prices, and flight durations. "
-             f"Use real data from flight booking sites to provide accurate, current pricing.",
+        goal=_flight_goal(destination, trip_dates),
         backstory="You are a world-renowned aviation expert with over 15 years of experience "
                   "in the travel industry. Having worked with major airlines and booking platforms, "
                   "you possess insider knowledge of pricing algorithms, seasonal trends, and "
@@ -165,6 +242,7 @@ def create_flight_agent(destination: str, trip_dates: str):
                   "trust you to balance cost-efficiency with comfort and convenience. You pride "
                   "yourself on staying updated with real-time flight data and industry changes.",
         tools=[search_flight_prices],
+        llm=_shared_llm(),
         verbose=True,
         allow_delegation=False
     )
@@ -172,14 +250,7 @@ def create_flight_agent(destination: str, trip_dates: str):
 
 def create_hotel_agent(destination: str, trip_dates: str):
     """Create the Accommodation Specialist agent with real research tools."""
-    # Determine main city for hotels (if destination is just a country, use capital)
-    hotel_location = destination
-    if destination.lower() == "iceland":
-        hotel_location = "Reykjavik"
-    elif destination.lower() == "france":
-        hotel_location = "Paris"
-    elif destination.lower() == "japan":
-        hotel_location = "Tokyo"
+    hotel_location = _hotel_city(destination)
 
     # Original role: "Accommodation Specialist"
     # Original backstory: "You are a seasoned accommodation expert with extensive knowledge of "
@@ -190,9 +261,7 @@ def create_hotel_agent(destination: str, trip_dates: str):
 
     return Agent(
         role="Elite Hospitality Concierge",  # Modified from: "Accommodation Specialist"
-        goal=f"Suggest top-rated hotels in {hotel_location} for the {destination} trip "
-             f"({trip_dates}), considering amenities, location, and value for money. "
-             f"Use real hotel data from booking sites with current prices and reviews.",
+        goal=_hotel_goal(hotel_location, destination, trip_dates),
         backstory="You are a distinguished hospitality concierge with an impeccable reputation "
                   "in luxury and boutique hotel curation. Having visited over 500 properties "
                   "worldwide and maintained relationships with hotel managers globally, you "
@@ -203,6 +272,7 @@ def create_hotel_agent(destination: str, trip_dates: str):
                   "you features in top travel magazines and a loyal following of satisfied clients "
                   "who trust your meticulous research and insider knowledge.",
         tools=[search_hotel_options],
+        llm=_shared_llm(),
         verbose=True,
         allow_delegation=False
     )
@@ -220,19 +290,10 @@ def create_itinerary_agent(destination: str, trip_duration: str):
     
     return Agent(
         role="Master Travel Experience Designer",  # Modified from: "Travel Planner"
-        goal=f"Create a detailed day-by-day travel plan with activities and attractions "
-             f"that maximize the {destination} experience in {trip_duration}. "
-             f"Use real current information about attractions, opening hours, and accessibility.",
-        backstory=f"You are an award-winning travel designer with a deep cultural connection to "
-                  f"{destination}. After living there for several years and leading hundreds of tours, "
-                  f"you've developed an intimate understanding of the destination's soul - from iconic "
-                  f"landmarks to secret local spots that tourists rarely discover. Your itineraries "
-                  f"are legendary for their perfect pacing, mixing popular attractions with authentic "
-                  f"experiences. You consider everything: seasonal weather patterns, crowd levels, "
-                  f"optimal visiting times, and the cultural significance of each location. Travel "
-                  f"bloggers often cite your recommendations, and your clients describe your itineraries "
-                  f"as 'life-changing journeys' rather than simple vacation plans.",
+        goal=_itinerary_goal(destination, trip_duration),
+        backstory=_itinerary_backstory(destination),
         tools=[search_attractions_activities],
+        llm=_shared_llm(),
         verbose=True,
         allow_delegation=False
     )
@@ -250,8 +311,7 @@ def create_budget_agent(destination: str):
     
     return Agent(
         role="Travel Finance Optimization Expert",  # Modified from: "Financial Advisor"
-        goal=f"Calculate total trip costs for {destination} and identify cost-saving opportunities "
-             f"while maintaining quality. Use real current pricing data for all expenses.",
+        goal=_budget_goal(destination),
         backstory="You are a certified financial planner who specializes exclusively in travel economics. "
                   "With an MBA in Hospitality Management and a background in international finance, "
                   "you've mastered the art of maximizing travel value. You've personally audited "
@@ -264,6 +324,7 @@ def create_budget_agent(destination: str):
                   "cost-optimization strategies, and travelers credit you with making their dream "
                   "trips financially achievable.",
         tools=[search_travel_costs],
+        llm=_shared_llm(),
         verbose=True,
         allow_delegation=False
     )
@@ -274,8 +335,7 @@ def create_marketing_agent(destination: str):
     """Create the Marketing Specialist agent (NEW - Exercise 3)."""
     return Agent(
         role="Travel Marketing Strategist",
-        goal=f"Create a compelling marketing summary for the {destination} trip package "
-             f"that highlights unique selling points and appeals to target travelers.",
+        goal=_marketing_goal(destination),
         backstory="You are a creative marketing strategist specializing in travel and tourism with "
                   "15 years of experience crafting compelling travel narratives. You've worked with "
                   "major travel brands and boutique tour operators, creating campaigns that convert "
@@ -286,6 +346,7 @@ def create_marketing_agent(destination: str):
                   "has consistently achieved high conversion rates by balancing aspirational imagery "
                   "with practical details that help travelers envision their perfect trip.",
         tools=[],  # Marketing agent doesn't need research tools, works with provided context
+        llm=_shared_llm(),
         verbose=True,
         allow_delegation=False
     )
@@ -295,103 +356,158 @@ def create_marketing_agent(destination: str):
 # TASK DEFINITIONS
 # ============================================================================
 
+# Task text templates, formatted with the trip parameters. The text is cached
+# per trip as (description, expected_output); the Task objects themselves are
+# built fresh each time, since they hold the agent and record their output
+# when the crew runs.
+
+_FLIGHT_TASK_DESCRIPTION = ("Research and compile a list of REAL flight options from {departure_city} to {destination} "
+                            "for the trip ({trip_dates}). "
+                            "Use actual current flight data from booking sites like Skyscanner, Kayak, "
+                            "Google Flights, or Expedia. Find at least 2-3 different flight options from "
+                            "major airlines, including details about departure times, arrival times, "
+                            "duration, and current realistic prices. Provide "
+                            "recommendations on which flight offers the best value considering both "
+                            "price and convenience.")
+_FLIGHT_TASK_OUTPUT = ("A detailed report with 2-3 REAL flight options from {departure_city} to {destination} "
+                       "including airlines, times, duration, current prices, and a recommendation with reasoning based on "
+                       "actual data from flight booking sites")
+
+_HOTEL_TASK_DESCRIPTION = ("Based on the trip dates ({trip_dates}), find and recommend "
+                           "the top 3-4 REAL hotels in {hotel_location}. Research actual hotels "
+                           "on Booking.com, TripAdvisor, Google Hotels, and Expedia. For each hotel, "
+                           "provide the actual name, current guest ratings, real prices per night, "
+                           "confirmed amenities, and explain why it suits this trip. "
+                           "Include a mix of budget, mid-range, and luxury options with honest reviews.")
+_HOTEL_TASK_OUTPUT = ("A curated list of 3-4 REAL hotel recommendations in {hotel_location} with actual details "
+                      "about each hotel, confirmed amenities, real guest ratings, current prices, "
+                      "and personalized recommendations based on actual guest reviews")
+
+_ITINERARY_TASK_DESCRIPTION = ("Create a detailed {trip_duration} itinerary for {destination} ({trip_dates}) based on "
+                               "REAL current information. Research actual attractions, their opening hours, "
+                               "accessibility, and entry fees. Plan day-by-day activities including visits "
+                               "to real attractions and verified sites. Include realistic estimated travel times between "
+                               "locations, activity durations, and recommended visit times. Consider actual "
+                               "weather patterns for this time period in {destination} and make the itinerary realistic and well-paced.")
+_ITINERARY_TASK_OUTPUT = ("A detailed day-by-day itinerary for {destination} with REAL activities based on verified "
+                          "attractions, realistic travel times, accurate estimated durations, current "
+                          "entry fees, and practical tips for {trip_duration} trip to {destination}")
+
+_BUDGET_TASK_DESCRIPTION = ("Based on the REAL flight options, hotel recommendations, and itinerary "
+                            "created by the other agents, calculate a comprehensive budget for the "
+                            "{trip_duration} {destination} trip using current pricing. Research and include actual "
+                            "costs for flights, accommodation, meals (use real restaurant prices in the destination), "
+                            "activities/tours (verified prices), transportation within {destination}, "
+                            "and miscellaneous expenses. Provide total cost estimates "
+                            "for budget, mid-range, and luxury options based on real prices. Suggest "
+                            "genuine cost-saving tips based on current market conditions.")
+_BUDGET_TASK_OUTPUT = ("A comprehensive budget report with itemized REAL costs for flights, "
+                       "accommodation, meals, activities with actual entry fees, transportation, "
+                       "and total realistic estimates at different budget levels, plus "
+                       "evidence-based cost-saving recommendations for a {trip_duration} trip to {destination}")
+
+_MARKETING_TASK_DESCRIPTION = ("Create a compelling marketing summary for the {trip_duration} {destination} trip package "
+                               "based on all the information gathered by other agents (flights, hotels, itinerary, budget). "
+                               "Your summary should: "
+                               "1) Highlight 3-5 unique selling points that make this package special "
+                               "2) Create an engaging headline and opening paragraph "
+                               "3) Include key package details in an appealing way "
+                               "4) Address potential traveler concerns (value, safety, experience quality) "
+                               "5) End with a strong call-to-action "
+                               "Write in an enthusiastic but authentic tone that inspires booking decisions. "
+                               "Keep it concise (250-300 words) but impactful.")
+_MARKETING_TASK_OUTPUT = ("A polished marketing summary with headline, engaging body copy highlighting "
+                          "unique value propositions, key package details, and persuasive call-to-action "
+                          "for the {destination} trip")
+
+
+@functools.lru_cache(maxsize=32)
+def _flight_task_text(destination: str, trip_dates: str, departure_city: str) -> tuple:
+    fields = dict(departure_city=departure_city, destination=destination, trip_dates=trip_dates)
+    return _FLIGHT_TASK_DESCRIPTION.format(**fields), _FLIGHT_TASK_OUTPUT.format(**fields)
+
+
+@functools.lru_cache(maxsize=32)
+def _hotel_task_text(destination: str, trip_dates: str) -> tuple:
+    hotel_location = _hotel_city(destination)
+    fields = dict(trip_dates=trip_dates, hotel_location=hotel_location)
+    return _HOTEL_TASK_DESCRIPTION.format(**fields), _HOTEL_TASK_OUTPUT.format(**fields)
+
+
+@functools.lru_cache(maxsize=32)
+def _itinerary_task_text(destination: str, trip_duration: str, trip_dates: str) -> tuple:
+    fields = dict(trip_duration=trip_duration, destination=destination, trip_dates=trip_dates)
+    return _ITINERARY_TASK_DESCRIPTION.format(**fields), _ITINERARY_TASK_OUTPUT.format(**fields)
+
+
+@functools.lru_cache(maxsize=32)
+def _budget_task_text(destination: str, trip_duration: str) -> tuple:
+    fields = dict(trip_duration=trip_duration, destination=destination)
+    return _BUDGET_TASK_DESCRIPTION.format(**fields), _BUDGET_TASK_OUTPUT.format(**fields)
+
+
+@functools.lru_cache(maxsize=32)
+def _marketing_task_text(destination: str, trip_duration: str) -> tuple:
+    fields = dict(trip_duration=trip_duration, destination=destination)
+    return _MARKETING_TASK_DESCRIPTION.format(**fields), _MARKETING_TASK_OUTPUT.format(**fields)
+
+
 def create_flight_task(flight_agent, destination: str, trip_dates: str, departure_city: str):
     """Define the flight research task using real data."""
+    description, expected_output = _flight_task_text(destination, trip_dates, departure_city)
     return Task(
-        description=f"Research and compile a list of REAL flight options from {departure_city} to {destination} "
-                   f"for the trip ({trip_dates}). "
-                   f"Use actual current flight data from booking sites like Skyscanner, Kayak, "
-                   f"Google Flights, or Expedia. Find at least 2-3 different flight options from "
-                   f"major airlines, including details about departure times, arrival times, "
-                   f"duration, and current realistic prices. Provide "
-                   f"recommendations on which flight offers the best value considering both "
-                   f"price and convenience.",
+        description=description,
         agent=flight_agent,
-        expected_output=f"A detailed report with 2-3 REAL flight options from {departure_city} to {destination} "
-                       f"including airlines, times, duration, current prices, and a recommendation with reasoning based on "
-                       f"actual data from flight booking sites"
+        expected_output=expected_output,
+        async_execution=True  # Independent research task - runs alongside hotel/itinerary
     )
 
 
 def create_hotel_task(hotel_agent, destination: str, trip_dates: str):
     """Define the hotel recommendation task using real data."""
-    # Determine main city for hotels
-    hotel_location = destination
-    if destination.lower() == "iceland":
-        hotel_location = "Reykjavik"
-    elif destination.lower() == "france":
-        hotel_location = "Paris"
-    elif destination.lower() == "japan":
-        hotel_location = "Tokyo"
-
+    description, expected_output = _hotel_task_text(destination, trip_dates)
     return Task(
-        description=f"Based on the trip dates ({trip_dates}), find and recommend "
-                   f"the top 3-4 REAL hotels in {hotel_location}. Research actual hotels "
-                   f"on Booking.com, TripAdvisor, Google Hotels, and Expedia. For each hotel, "
-                   f"provide the actual name, current guest ratings, real prices per night, "
-                   f"confirmed amenities, and explain why it suits this trip. "
-                   f"Include a mix of budget, mid-range, and luxury options with honest reviews.",
+        description=description,
         agent=hotel_agent,
-        expected_output=f"A curated list of 3-4 REAL hotel recommendations in {hotel_location} with actual details "
-                       f"about each hotel, confirmed amenities, real guest ratings, current prices, "
-                       f"and personalized recommendations based on actual guest reviews"
+        expected_output=expected_output,
+        async_execution=True  # Independent research task - runs alongside flight/itinerary
     )
 
 
 def create_itinerary_task(itinerary_agent, destination: str, trip_duration: str, trip_dates: str):
     """Define the itinerary planning task using real information."""
+    description, expected_output = _itinerary_task_text(destination, trip_duration, trip_dates)
     return Task(
-        description=f"Create a detailed {trip_duration} itinerary for {destination} ({trip_dates}) based on "
-                   f"REAL current information. Research actual attractions, their opening hours, "
-                   f"accessibility, and entry fees. Plan day-by-day activities including visits "
-                   f"to real attractions and verified sites. Include realistic estimated travel times between "
-                   f"locations, activity durations, and recommended visit times. Consider actual "
-                   f"weather patterns for this time period in {destination} and make the itinerary realistic and well-paced.",
+        description=description,
         agent=itinerary_agent,
-        expected_output=f"A detailed day-by-day itinerary for {destination} with REAL activities based on verified "
-                       f"attractions, realistic travel times, accurate estimated durations, current "
-                       f"entry fees, and practical tips for {trip_duration} trip to {destination}"
+        expected_output=expected_output,
+        async_execution=True  # Independent research task - runs alongside flight/hotel
     )
 
 
-def create_budget_task(budget_agent, destination: str, trip_duration: str):
-    """Define the budget calculation task using real cost data."""
+def create_budget_task(budget_agent, destination: str, trip_duration: str, context: list):
+    """Define the budget calculation task using real cost data.
+
+    The crew waits for every task in context to finish before running this one.
+    """
+    description, expected_output = _budget_task_text(destination, trip_duration)
     return Task(
-        description=f"Based on the REAL flight options, hotel recommendations, and itinerary "
-                   f"created by the other agents, calculate a comprehensive budget for the "
-                   f"{trip_duration} {destination} trip using current pricing. Research and include actual "
-                   f"costs for flights, accommodation, meals (use real restaurant prices in the destination), "
-                   f"activities/tours (verified prices), transportation within {destination}, "
-                   f"and miscellaneous expenses. Provide total cost estimates "
-                   f"for budget, mid-range, and luxury options based on real prices. Suggest "
-                   f"genuine cost-saving tips based on current market conditions.",
+        description=description,
         agent=budget_agent,
-        expected_output=f"A comprehensive budget report with itemized REAL costs for flights, "
-                       f"accommodation, meals, activities with actual entry fees, transportation, "
-                       f"and total realistic estimates at different budget levels, plus "
-                       f"evidence-based cost-saving recommendations for a {trip_duration} trip to {destination}"
+        expected_output=expected_output,
+        context=context
     )
 
 
 # NEW TASK ADDED - Exercise 3
-def create_marketing_task(marketing_agent, destination: str, trip_duration: str):
+def create_marketing_task(marketing_agent, destination: str, trip_duration: str, context: list):
     """Define the marketing summary task (NEW - Exercise 3)."""
+    description, expected_output = _marketing_task_text(destination, trip_duration)
     return Task(
-        description=f"Create a compelling marketing summary for the {trip_duration} {destination} trip package "
-                   f"based on all the information gathered by other agents (flights, hotels, itinerary, budget). "
-                   f"Your summary should: "
-                   f"1) Highlight 3-5 unique selling points that make this package special "
-                   f"2) Create an engaging headline and opening paragraph "
-                   f"3) Include key package details in an appealing way "
-                   f"4) Address potential traveler concerns (value, safety, experience quality) "
-                   f"5) End with a strong call-to-action "
-                   f"Write in an enthusiastic but authentic tone that inspires booking decisions. "
-                   f"Keep it concise (250-300 words) but impactful.",
+        description=description,
         agent=marketing_agent,
-        expected_output=f"A polished marketing summary with headline, engaging body copy highlighting "
-                       f"unique value propositions, key package details, and persuasive call-to-action "
-                       f"for the {destination} trip",
-        context=[]  # Will be populated with outputs from previous tasks
+        expected_output=expected_output,
+        context=context  # Outputs from the research and budget tasks
     )
 
 
@@ -399,32 +515,18 @@ def create_marketing_task(marketing_agent, destination: str, trip_duration: str)
 # CREW ORCHESTRATION
 # ============================================================================
 
-def main(destination: str = "Iceland", trip_duration: str = "5 days",
-         trip_dates: str = "January 15-20, 2026", departure_city: str = "New York",
-         travelers: int = 2, budget_preference: str = "mid-range"):
-    """
-    Main function to orchestrate the travel planning crew.
+_CONFIGURED = False
 
-    Args:
-        destination: Travel destination (e.g., "Iceland", "France", "Japan")
-        trip_duration: Duration of trip (e.g., "5 days", "7 days")
-        trip_dates: Specific dates (e.g., "January 15-20, 2026")
-        departure_city: City you're departing from (e.g., "New York", "Los Angeles")
-        travelers: Number of travelers
-        budget_preference: Budget level ("budget", "mid-range", "luxury")
+
+def _configure_once(verbose: bool = True):
     """
+    Validate the configuration and export it for CrewAI, once per process.
 
-    print("=" * 80)
-    print("CrewAI Multi-Agent Travel Planning System (REAL API VERSION)")
-    print(f"Planning a {trip_duration} Trip to {destination}")
-    print("=" * 80)
-    print()
-    print(f"📍 Destination: {destination}")
-    print(f"📅 Dates: {trip_dates}")
-    print(f"✈️  Departure from: {departure_city}")
-    print(f"👥 Travelers: {travelers}")
-    print(f"💰 Budget: {budget_preference}")
-    print()
+    Later calls (e.g. the other destinations of a batch run) return at once.
+    """
+    global _CONFIGURED
+    if _CONFIGURED:
+        return
 
     # Validate configuration before proceeding
     print("🔍 Validating configuration...")
@@ -436,36 +538,67 @@ def main(destination: str = "Iceland", trip_duration: str = "5 days",
     # CrewAI uses OPENAI_API_KEY and OPENAI_API_BASE environment variables
     os.environ["OPENAI_API_KEY"] = Config.API_KEY
     os.environ["OPENAI_API_BASE"] = Config.API_BASE
-    
+
     # For Groq compatibility, also set OPENAI_MODEL_NAME
     if Config.USE_GROQ:
         os.environ["OPENAI_MODEL_NAME"] = Config.OPENAI_MODEL
 
     print("✅ Configuration validated successfully!")
     print()
-    Config.print_summary()
-    print()
-    print("⚠️  IMPORTANT: This version uses REAL OpenAI API calls and web search")
-    print("    Agents will research actual current prices and real information")
-    print()
-    print("Tip: Check your API usage at https://platform.openai.com/account/usage")
-    print()
+    if verbose:
+        Config.print_summary()
+        print()
+        print("⚠️  IMPORTANT: This version uses REAL OpenAI API calls and web search")
+        print("    Agents will research actual current prices and real information")
+        print()
+        print("Tip: Check your API usage at https://platform.openai.com/account/usage")
+        print()
+    _CONFIGURED = True
+
+# Final reports are kept on disk, keyed on the trip parameters, so re-running
+# the same trip does not spend the API calls again
+_memory = Memory(_MODULE_DIR / ".crew_cache", verbose=0)
+
+
+def _task_section(agent: str, text: str) -> str:
+    """Format one task's output as a section of the saved report."""
+    return f"[{agent}]\n{text}\n" + "-" * 80 + "\n"
+
+
+@_memory.cache(ignore=["on_task_done"])
+async def _run_crew(destination: str, trip_duration: str, trip_dates: str, departure_city: str,
+                    travelers: int, budget_preference: str, day: str, include_marketing: bool = True,
+                    on_task_done=None) -> list:
+    """
+    Build the agents, tasks and crew for one trip and return the task outputs.
 
+    Returns a list of (agent role, output) pairs in task order; the last one is
+    the final report (the budget report when include_marketing is False, as
+    the marketing agent and task are then not created).
+
+    on_task_done is called with each TaskOutput as soon as its task finishes.
+    day is only part of the cache key: cached reports expire when the date
+    changes, so prices are researched again at least once a day.
+    """
     # Create agents with destination parameters
-    print("[1/5] Creating Flight Specialist Agent (researches real flights)...")
+    n_agents = 5 if include_marketing else 4
+    print(f"[1/{n_agents}] Creating Flight Specialist Agent (researches real flights)...")
     flight_agent = create_flight_agent(destination, trip_dates)
 
-    print("[2/5] Creating Accommodation Specialist Agent (researches real hotels)...")
+    print(f"[2/{n_agents}] Creating Accommodation Specialist Agent (researches real hotels)...")
     hotel_agent = create_hotel_agent(destination, trip_dates)
 
-    print("[3/5] Creating Travel Planner Agent (researches real attractions)...")
+    print(f"[3/{n_agents}] Creating Travel Planner Agent (researches real attractions)...")
     itinerary_agent = create_itinerary_agent(destination, trip_duration)
 
-    print("[4/5] Creating Financial Advisor Agent (analyzes real costs)...")
+    print(f"[4/{n_agents}] Creating Financial Advisor Agent (analyzes real costs)...")
     budget_agent = create_budget_agent(destination)
+    agents = [flight_agent, hotel_agent, itinerary_agent, budget_agent]
 
-    print("[5/5] Creating Marketing Strategist Agent (creates compelling summary)... [NEW - Exercise 3]")
-    marketing_agent = create_marketing_agent(destination)
+    if include_marketing:
+        print("[5/5] Creating Marketing Strategist Agent (creates compelling summary)... [NEW - Exercise 3]")
+        marketing_agent = create_marketing_agent(destination)
+        agents.append(marketing_agent)
 
     print("\n✅ All agents created successfully!")
     print()
@@ -475,22 +608,33 @@ def main(destination: str = "Iceland", trip_duration: str = "5 days",
     flight_task = create_flight_task(flight_agent, destination, trip_dates, departure_city)
     hotel_task = create_hotel_task(hotel_agent, destination, trip_dates)
     itinerary_task = create_itinerary_task(itinerary_agent, destination, trip_duration, trip_dates)
-    budget_task = create_budget_task(budget_agent, destination, trip_duration)
-    marketing_task = create_marketing_task(marketing_agent, destination, trip_duration)  # NEW TASK - Exercise 3
+    # Flight, hotel and itinerary research run in parallel; budget and marketing wait for them
+    research_tasks = [flight_task, hotel_task, itinerary_task]
+    budget_task = create_budget_task(budget_agent, destination, trip_duration, context=research_tasks)
+    tasks = research_tasks + [budget_task]
+    if include_marketing:
+        marketing_task = create_marketing_task(marketing_agent, destination, trip_duration,
+                                               context=research_tasks + [budget_task])  # NEW TASK - Exercise 3
+        tasks.append(marketing_task)
 
     print("Tasks created successfully!")
     print()
 
-    # Create the crew with sequential task execution
+    # Create the crew; async tasks run concurrently until a task that needs them as context
     print("Forming the Travel Planning Crew...")
-    print("Task Sequence: FlightAgent → HotelAgent → ItineraryAgent → BudgetAgent → MarketingAgent [NEW]")
+    print("Task Sequence: (FlightAgent | HotelAgent | ItineraryAgent in parallel) → BudgetAgent"
+          + (" → MarketingAgent [NEW]" if include_marketing else ""))
     print()
 
     crew = Crew(
-        agents=[flight_agent, hotel_agent, itinerary_agent, budget_agent, marketing_agent],  # Added marketing_agent
-        tasks=[flight_task, hotel_task, itinerary_task, budget_task, marketing_task],  # Added marketing_task
+        agents=agents,  # Includes marketing_agent unless include_marketing is False
+        tasks=tasks,  # Includes marketing_task unless include_marketing is False
         verbose=True,
-        process="sequential"  # Sequential task execution
+        process="sequential",  # Sequential order; async_execution tasks still overlap
+        cache=True,  # Reuse tool results for identical tool calls within the crew
+        max_rpm=Config.MAX_RPM,  # Stay under the provider's rate limit when crews run concurrently
+        memory=Config.CREW_MEMORY,  # Shared crew memory; needs an embeddings endpoint
+        task_callback=on_task_done
     )
 
     # Execute the crew
@@ -500,31 +644,77 @@ def main(destination: str = "Iceland", trip_duration: str = "5 days",
     print("=" * 80)
     print()
 
-    try:
-        result = crew.kickoff(inputs={
-            "trip_destination": destination,
-            "trip_duration": trip_duration,
-            "trip_dates": trip_dates,
-            "departure_city": departure_city,
-            "travelers": travelers,
-            "budget_preference": budget_preference
-        })
+    # Read-only, so nothing in the crew can change the trip parameters mid-run. It is
+    # built here rather than passed in because joblib cannot pickle a mappingproxy
+    inputs = MappingProxyType({
+        "trip_destination": destination,
+        "trip_duration": trip_duration,
+        "trip_dates": trip_dates,
+        "departure_city": departure_city,
+        "travelers": travelers,
+        "budget_preference": budget_preference
+    })
+    result = await crew.kickoff_async(inputs=inputs)
+    return [(output.agent, output.raw) for output in result.tasks_output]
+
+
+_TROUBLESHOOTING = """
+🔍 Troubleshooting:
+   1. Verify OPENAI_API_KEY is set: export OPENAI_API_KEY='sk-...'
+   2. Check API key is valid and has sufficient credits
+   3. Verify internet connection for web research
+   4. Check OpenAI API status at https://status.openai.com
 
-        print()
-        print("=" * 80)
-        print("✅ Crew Execution Completed Successfully!")
-        print("=" * 80)
-        print()
-        print(f"FINAL TRAVEL PLAN REPORT FOR {destination.upper()} (Based on Real API Data):")
-        print("-" * 80)
-        print(result)
-        print("-" * 80)
+"""
+
+
+async def main_async(destination: str = "Iceland", trip_duration: str = "5 days",
+                     trip_dates: str = "January 15-20, 2026", departure_city: str = "New York",
+                     travelers: int = 2, budget_preference: str = "mid-range",
+                     use_cache: bool = True, verbose: bool = True, include_marketing: bool = True):
+    """
+    Main function to orchestrate the travel planning crew.
 
-        # Save output to file
-        output_filename = f"crewai_output_{destination.lower()}.txt"
-        output_path = Path(__file__).parent / output_filename
+    Runs the crew with kickoff_async(), so several trips can be planned
+    concurrently from one event loop (see main_many).
 
-        with open(output_path, "w") as f:
+    Args:
+        destination: Travel destination (e.g., "Iceland", "France", "Japan")
+        trip_duration: Duration of trip (e.g., "5 days", "7 days")
+        trip_dates: Specific dates (e.g., "January 15-20, 2026")
+        departure_city: City you're departing from (e.g., "New York", "Los Angeles")
+        travelers: Number of travelers
+        budget_preference: Budget level ("budget", "mid-range", "luxury")
+        use_cache: Reuse a report already produced today for the same trip
+        verbose: Print the configuration summary and API usage notes
+        include_marketing: Add the marketing summary task (one more LLM-driven task)
+    """
+    # Each block is printed in one call, so concurrent runs (main_many) don't interleave lines
+    print("\n".join([
+        "=" * 80,
+        "CrewAI Multi-Agent Travel Planning System (REAL API VERSION)",
+        f"Planning a {trip_duration} Trip to {destination}",
+        "=" * 80,
+        "",
+        f"📍 Destination: {destination}",
+        f"📅 Dates: {trip_dates}",
+        f"✈️  Departure from: {departure_city}",
+        f"👥 Travelers: {travelers}",
+        f"💰 Budget: {budget_preference}",
+        "",
+    ]))
+
+    _configure_once(verbose)
+
+    # The report file is opened before the crew starts and each task's output is
+    # appended as it finishes, so a failed run still leaves the completed sections
+    output_filename = f"crewai_output_{destination.lower()}.txt"
+    output_path = _MODULE_DIR / output_filename
+
+    try:
+        from datetime import date, datetime  # Only needed for the report timestamp and cache key
+
+        with open(output_path, "w", buffering=1) as f:  # Line-buffered: sections reach disk as written
             f.write("=" * 80 + "\n")
             f.write("CrewAI Multi-Agent Travel Planning System - Real API Execution Report\n")
             f.write(f"Planning a {trip_duration} Trip to {destination}\n")
@@ -544,54 +734,97 @@ def main(destination: str = "Iceland", trip_duration: str = "5 days",
             f.write("- Prices are current as of the date this was run\n")
             f.write("- Hotel availability and prices may vary by booking date\n")
             f.write("- Weather conditions and attraction hours should be verified before travel\n\n")
-            f.write("FINAL TRAVEL PLAN REPORT:\n")
+            f.write("TASK REPORTS (in order of completion; the last is the final travel plan):\n")
             f.write("-" * 80 + "\n")
-            f.write(str(result))
-            f.write("\n" + "-" * 80 + "\n")
 
-        print(f"\n✅ Output saved to {output_filename}")
-        print("ℹ️  Note: All data in this report is based on REAL API calls to OpenAI")
-        print("    and research of current travel information sources.")
+            # Parallel research tasks finish on worker threads, so writes are serialized
+            write_lock = threading.Lock()
+
+            def write_task_output(output):
+                with write_lock:
+                    f.write(_task_section(output.agent, output.raw))
+
+            crew_args = (destination, trip_duration, trip_dates, departure_city,
+                         travelers, budget_preference, date.today().isoformat(), include_marketing)
+            if use_cache and _run_crew.check_call_in_cache(*crew_args):
+                print("♻️  Reusing today's cached report for this trip (run with --no-cache to refresh)")
+                task_outputs = await _run_crew(*crew_args)
+                for agent, text in task_outputs:  # No tasks ran, so write the cached sections
+                    f.write(_task_section(agent, text))
+            elif use_cache:
+                task_outputs = await _run_crew(*crew_args, on_task_done=write_task_output)
+            else:
+                # Re-runs the crew and refreshes the cache
+                task_outputs, _ = await _run_crew.call(*crew_args, on_task_done=write_task_output)
+
+        print("\n".join([
+            "",
+            "=" * 80,
+            "✅ Crew Execution Completed Successfully!",
+            "=" * 80,
+            "",
+            f"FINAL TRAVEL PLAN REPORT FOR {destination.upper()} (Based on Real API Data):",
+            "-" * 80,
+            task_outputs[-1][1],
+            "-" * 80,
+            "",
+            f"✅ Output saved to {output_filename}",
+            "ℹ️  Note: All data in this report is based on REAL API calls to OpenAI",
+            "    and research of current travel information sources.",
+        ]))
 
     except Exception as e:
-        print(f"\n❌ Error during crew execution: {str(e)}")
-        print("\n🔍 Troubleshooting:")
-        print("   1. Verify OPENAI_API_KEY is set: export OPENAI_API_KEY='sk-...'")
-        print("   2. Check API key is valid and has sufficient credits")
-        print("   3. Verify internet connection for web research")
-        print("   4. Check OpenAI API status at https://status.openai.com")
-        print()
+        # Goes to stderr with the traceback below
+        sys.stderr.write(f"\n❌ Error during crew execution ({destination}): {str(e)}\n" + _TROUBLESHOOTING)
         import traceback
         traceback.print_exc()
 
 
+def main(*args, **kwargs):
+    """Plan a single trip from synchronous code (arguments as for main_async)."""
+    asyncio.run(main_async(*args, **kwargs))
+
+
+async def main_many(destinations: list, **kwargs):
+    """
+    Plan trips to several destinations concurrently, one crew per destination.
+
+    Each crew uses kickoff_async(); mixing in the blocking kickoff() would
+    serialize them again. Other keyword arguments are passed to main_async.
+    """
+    await asyncio.gather(*(main_async(destination, **kwargs) for destination in destinations))
+
+
 if __name__ == "__main__":
-    # Allow command line arguments to override defaults
-    import sys
-
-    kwargs = {
-        "destination": "Iceland",
-        "trip_duration": "5 days",
-        "trip_dates": "January 15-20, 2026",
-        "departure_city": "New York",
-        "travelers": 2,
-        "budget_preference": "mid-range"
-    }
-
-    # Parse command line arguments (optional)
-    # Usage: python crewai_demo.py [destination] [duration] [departure_city]
+    import argparse
+
+    # Usage: python crewai_demo.py [destination] [duration] [departure_city] [dates] [travelers] [budget]
     # Example: python crewai_demo.py "France" "7 days" "Los Angeles"
-    if len(sys.argv) > 1:
-        kwargs["destination"] = sys.argv[1]
-    if len(sys.argv) > 2:
-        kwargs["trip_duration"] = sys.argv[2]
-    if len(sys.argv) > 3:
-        kwargs["departure_city"] = sys.argv[3]
-    if len(sys.argv) > 4:
-        kwargs["trip_dates"] = sys.argv[4]
-    if len(sys.argv) > 5:
-        kwargs["travelers"] = int(sys.argv[5])
-    if len(sys.argv) > 6:
-        kwargs["budget_preference"] = sys.argv[6]
-
-    main(**kwargs)
+    # Example: python crewai_demo.py --destinations Iceland France Japan   (planned concurrently)
+    parser = argparse.ArgumentParser(description="Plan a trip with a CrewAI travel planning crew.")
+    parser.add_argument("destination", nargs="?", default="Iceland",
+                        help="Travel destination (default: Iceland)")
+    parser.add_argument("trip_duration", nargs="?", default="5 days",
+                        help='Duration of the trip (default: "5 days")')
+    parser.add_argument("departure_city", nargs="?", default="New York",
+                        help='City you are departing from (default: "New York")')
+    parser.add_argument("trip_dates", nargs="?", default="January 15-20, 2026",
+                        help='Specific dates (default: "January 15-20, 2026")')
+    parser.add_argument("travelers", nargs="?", type=int, default=2,
+                        help="Number of travelers (default: 2)")
+    parser.add_argument("budget_preference", nargs="?", default="mid-range",
+                        choices=["budget", "mid-range", "luxury"], metavar="budget_preference",
+                        help="Budget level: budget, mid-range or luxury (default: mid-range)")
+    parser.add_argument("--destinations", nargs="+", metavar="DESTINATION",
+                        help="Plan several destinations concurrently (overrides the destination argument)")
+    parser.add_argument("--no-cache", dest="use_cache", action="store_false",
+                        help="Run the crew even if today's report for this trip is cached")
+    parser.add_argument("--no-marketing", dest="include_marketing", action="store_false",
+                        help="Skip the marketing summary; the budget report is the final output")
+    parser.add_argument("--quiet", dest="verbose", action="store_false",
+                        help="Skip the configuration summary and API usage notes")
+    args = vars(parser.parse_args())
+
+    destinations = args.pop("destinations") or [args["destination"]]
+    del args["destination"]
+    asyncio.run(main_many(destinations, **args))
@@ -53,6 +53,13 @@ class Config:
         API_KEY = OPENAI_API_KEY
         DEFAULT_MODEL = os.getenv("OPENAI_MODEL", "gpt-4-turbo-preview")
     
+    # API flavour of the endpoint: "openai", "groq" or "anthropic". Set PROVIDER to
+    # override; otherwise it is inferred from the key/endpoint. Anthropic endpoints
+    # get explicit prompt-cache markers in the AutoGen conference demo.
+    PROVIDER = os.getenv("PROVIDER", "").lower() or (
+        "anthropic" if "anthropic" in API_BASE else "groq" if USE_GROQ else "openai"
+    )
+
     # For backward compatibility
     OPENAI_API_BASE = API_BASE
     OPENAI_MODEL = os.getenv("OPENAI_MODEL") or os.getenv("GROQ_MODEL") or DEFAULT_MODEL
@@ -63,6 +70,9 @@ class Config:
     AGENT_TEMPERATURE = float(os.getenv("AGENT_TEMPERATURE", "0.7"))
     AGENT_MAX_TOKENS = int(os.getenv("AGENT_MAX_TOKENS", "2000"))
     AGENT_TIMEOUT = int(os.getenv("AGENT_TIMEOUT", "300"))
+    MAX_RPM = int(os.getenv("MAX_RPM", "60"))  # Per-crew request limit (CrewAI max_rpm)
+    # CrewAI crew memory. Off by default: it calls an embeddings API, which Groq does not offer
+    CREW_MEMORY = os.getenv("CREW_MEMORY", "False").lower() == "true"
 
     # ====================
     # Logging Settings
@@ -156,6 +166,8 @@ class Config:
             "agent_temperature": cls.AGENT_TEMPERATURE,
             "agent_max_tokens": cls.AGENT_MAX_TOKENS,
             "agent_timeout": cls.AGENT_TIMEOUT,
+            "max_rpm": cls.MAX_RPM,
+            "crew_memory": cls.CREW_MEMORY,
             "verbose": cls.VERBOSE,
             "debug": cls.DEBUG,
         }
@@ -181,6 +193,8 @@ class Config:
         print(f"✓ Temperature:       {cls.AGENT_TEMPERATURE}")
         print(f"✓ Max Tokens:        {cls.AGENT_MAX_TOKENS}")
         print(f"✓ Timeout:           {cls.AGENT_TIMEOUT}s")
+        print(f"✓ Max RPM:           {cls.MAX_RPM}")
+        print(f"✓ Crew Memory:       {cls.CREW_MEMORY}")
         print(f"✓ Verbose:           {cls.VERBOSE}")
         print(f"✓ Debug:             {cls.DEBUG}")
         print("="*60 + "\n")